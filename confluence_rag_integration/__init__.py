@@ -1,9 +1,10 @@
 """Simple entry point functions for the multi-tenant Confluence RAG integration."""
 
+import asyncio
 from typing import List, Optional
 from .customers.customer_manager import CustomerManager
 from .exporters.space_exporter import SpaceExporter
-from .rag.query_manager import QueryManager
+from .rag.query_manager import get_query_manager
 
 __version__ = "0.1.0"
 __author__ = "Confluence RAG Integration Team"
@@ -35,6 +36,21 @@ def index_customer(customer_id: str, clear_existing: bool = False):
 
 def query_customer(customer_id: str, question: str, top_k: int = 3):
     """Query documents for a customer."""
-    manager = CustomerManager()
-    query_mgr = QueryManager(manager)
-    return query_mgr.query(customer_id, question, top_k)
\ No newline at end of file
+    return get_query_manager().query(customer_id, question, top_k)
+
+
+async def aquery_customer(customer_id: str, question: str, top_k: int = 3):
+    """Query documents for a customer asynchronously."""
+    return await get_query_manager().aquery(customer_id, question, top_k)
+
+
+async def aquery_customer_many(customer_id: str, questions: List[str], top_k: int = 3,
+                               max_concurrency: int = 4):
+    """Query several questions for a customer concurrently, returning results in question order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run_query(question: str):
+        async with semaphore:
+            return await aquery_customer(customer_id, question, top_k)
+    
+    return await asyncio.gather(*(run_query(question) for question in questions))
@@ -0,0 +1,11 @@
+"""One-time process setup shared by the package entry points."""
+
+import functools
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=None)
+def load_env() -> bool:
+    """Load variables from .env once per process; later calls skip the filesystem search."""
+    return load_dotenv()
@@ -12,10 +12,10 @@ from pathlib import Path
 
 from ..graphs.confluence_rag_agent import create_agent
 from ..graphs.memory_manager import create_memory_manager
+from .._bootstrap import load_env
 from ..customers.customer_manager import CustomerManager
-from dotenv import load_dotenv
 
-load_dotenv()
+load_env()
 
 
 # Configure logging
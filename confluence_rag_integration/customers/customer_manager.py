@@ -1,13 +1,20 @@
 """Simplified customer management for multi-tenant Confluence RAG integration."""
 
-import json
+import orjson
 import yaml
 import os
 import re
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
-from ..shared.models import CustomerConfig, CustomerState
+from ..shared.models import (
+    RAG_BUILDING,
+    RAG_FAILED,
+    RAG_READY,
+    CustomerConfig,
+    CustomerState,
+)
+from ..shared.utils import dump_model
 
 
 class CustomerManager:
@@ -16,6 +23,8 @@ class CustomerManager:
     def __init__(self, base_path: Path = None):
         self.base_path = base_path or Path("data/customers")
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # customer_id -> ((mtime_ns, size), config)
+        self._configs: Dict[str, Tuple[Tuple[int, int], CustomerConfig]] = {}
     
     def _expand_env_vars(self, data: Any) -> Any:
         """Recursively expand environment variables in config data."""
@@ -46,27 +55,37 @@ class CustomerManager:
         customer_config_path = customer_dir / "config.yaml"
         with open(customer_config_path, 'w') as f:
             yaml.dump(config_data, f, default_flow_style=False)
+        # Coarse filesystem mtimes may not change on a quick re-create, so drop the cached config
+        self._configs.pop(config.customer_id, None)
         
         # Create empty state
         initial_state = CustomerState(customer_id=config.customer_id)
-        state_path = customer_dir / "state.json"
-        with open(state_path, 'w') as f:
-            json.dump(initial_state.__dict__, f, indent=2, default=str)
+        self._save_state(initial_state)
         
         return config
     
     def load_customer(self, customer_id: str) -> CustomerConfig:
         """Load customer config from customer directory."""
         config_path = self.base_path / customer_id / "config.yaml"
-        if not config_path.exists():
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
             raise ValueError(f"Customer {customer_id} not found")
         
+        # Reuse the parsed config until the file changes on disk
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._configs.get(customer_id)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
         with open(config_path, 'r') as f:
             config_data = yaml.safe_load(f)
         
         # Expand environment variables
         config_data = self._expand_env_vars(config_data)
-        return CustomerConfig(**config_data)
+        config = CustomerConfig(**config_data)
+        self._configs[customer_id] = (signature, config)
+        return config
     
     def get_state(self, customer_id: str) -> CustomerState:
         """Load customer state from state.json."""
@@ -74,12 +93,11 @@ class CustomerManager:
         if not state_path.exists():
             # Create default state if doesn't exist
             state = CustomerState(customer_id=customer_id)
-            with open(state_path, 'w') as f:
-                json.dump(state.__dict__, f, indent=2, default=str)
+            self._save_state(state)
             return state
         
-        with open(state_path, 'r') as f:
-            state_data = json.load(f)
+        # state.json is written as UTF-8 by orjson; read bytes so the locale encoding doesn't apply
+        state_data = orjson.loads(state_path.read_bytes())
         
         return CustomerState(**state_data)
     
@@ -87,10 +105,7 @@ class CustomerManager:
         """Update export state in state.json."""
         state = self.get_state(customer_id)
         state.last_export = result
-        
-        state_path = self.base_path / customer_id / "state.json"
-        with open(state_path, 'w') as f:
-            json.dump(state.__dict__, f, indent=2, default=str)
+        self._save_state(state)
     
     def update_index_state(self, customer_id: str, result: Dict[str, Any]) -> None:
         """Update index state in state.json."""
@@ -99,15 +114,18 @@ class CustomerManager:
         
         # Update RAG status based on result
         if result.get('status') == 'success':
-            state.rag_status = 'ready'
+            state.rag_status = RAG_READY
         elif result.get('status') == 'failed':
-            state.rag_status = 'failed'
+            state.rag_status = RAG_FAILED
         else:
-            state.rag_status = 'building'
+            state.rag_status = RAG_BUILDING
         
-        state_path = self.base_path / customer_id / "state.json"
-        with open(state_path, 'w') as f:
-            json.dump(state.__dict__, f, indent=2, default=str)
+        self._save_state(state)
+    
+    def _save_state(self, state: CustomerState) -> None:
+        """Persist customer state to state.json."""
+        state_path = self.base_path / state.customer_id / "state.json"
+        state_path.write_bytes(dump_model(state))
     
     def list_customers(self) -> list:
         """List all available customers."""
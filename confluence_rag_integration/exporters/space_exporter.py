@@ -1,7 +1,6 @@
 """Simplified space exporter for batch export operations."""
 
 import time
-from datetime import datetime
 from typing import List, Optional
 
 from ..customers.customer_manager import CustomerManager
@@ -66,7 +65,6 @@ class SpaceExporter:
                 status=status,
                 pages_exported=pages_exported,
                 errors=errors,
-                timestamp=datetime.now().isoformat(),
                 duration_seconds=duration
             )
             
@@ -81,7 +79,6 @@ class SpaceExporter:
                 status="failed",
                 pages_exported=0,
                 errors=[str(e)],
-                timestamp=datetime.now().isoformat(),
                 duration_seconds=duration
             )
             
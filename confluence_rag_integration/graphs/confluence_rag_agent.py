@@ -10,11 +10,10 @@ from langgraph.graph.message import MessagesState
 from langgraph.checkpoint.memory import MemorySaver
 import logging
 
-from ..customers.customer_manager import CustomerManager
-from ..rag.query_manager import QueryManager
-from dotenv import load_dotenv
+from .._bootstrap import load_env
+from ..rag.query_manager import get_query_manager
 
-load_dotenv()
+load_env()
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +34,8 @@ def retrieve_knowledge(
         customer_id = configurable.get("customer_id", "acme_corp")
         top_k = configurable.get("top_k", 3)
         
-        # Initialize managers
-        customer_manager = CustomerManager()
-        query_manager = QueryManager(customer_manager)
-        
-        # Execute query
-        result = query_manager.query(customer_id, query, top_k)
+        # Execute query with the shared manager so indexers are reused across calls
+        result = get_query_manager().query(customer_id, query, top_k)
         
         if result.status == "error":
             return f"Error retrieving documents: {result.error}"
@@ -101,7 +101,7 @@ class TicketResolutionGraph:
             # top_k should be configurable TODO
             
             # Execute the tool directly
-            result = self.retrieval_tool._run(**tool_input)
+            result = self.retrieval_tool.invoke(tool_input)
             
             # Parse results and deduplicate
             if isinstance(result, str) and "Document" in result:
@@ -7,7 +7,6 @@ by Claude Desktop and other MCP-compatible LLM applications.
 import logging
 from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server import NotificationOptions, Server
@@ -15,6 +14,7 @@ from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
+from ._bootstrap import load_env
 from .customers.customer_manager import CustomerManager
 from .rag.query_manager import QueryManager
 from .mcp_models import (
@@ -24,7 +24,7 @@ from .mcp_models import (
 )
 
 # Load environment variables
-load_dotenv()
+load_env()
 
 # Configure logging
 logging.basicConfig(
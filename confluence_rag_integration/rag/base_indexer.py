@@ -1,8 +1,94 @@
 """Base indexer interface for RAG indexing strategies."""
 
+import functools
+import itertools
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List
+
+from langchain_core.documents import Document
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+from ..shared.utils import iter_markdown_files
+
+
+# Threads used to read exported markdown files; loading is I/O-bound
+LOADER_MAX_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+# Files read ahead of the indexer; bounds how much of the corpus is held in memory
+LOADER_READ_AHEAD = LOADER_MAX_CONCURRENCY * 2
+
+# Texts per embedding API request, and how many requests may be in flight at once
+EMBEDDING_REQUEST_SIZE = 100
+EMBEDDING_MAX_CONCURRENCY = 5
+
+# Number of chunks handed to the vector store per index() batch; sized so one batch
+# fills every concurrent embedding request
+EMBEDDING_BATCH_SIZE = EMBEDDING_REQUEST_SIZE * EMBEDDING_MAX_CONCURRENCY
+
+
+class IndexingEmbeddings(GoogleGenerativeAIEmbeddings):
+    """Embeddings client tuned for bulk indexing.
+    
+    Byte-identical texts in a batch are embedded only once, since Confluence exports repeat
+    templated headers and footers across pages. The unique texts are split into API-sized
+    requests that are sent concurrently instead of one after another.
+    """
+    
+    def embed_documents(self, texts: List[str], *args: Any, **kwargs: Any) -> List[List[float]]:
+        if kwargs.get("titles") is not None:
+            return super().embed_documents(texts, *args, **kwargs)
+        
+        unique_texts = list(dict.fromkeys(texts))
+        requests = [
+            unique_texts[i:i + EMBEDDING_REQUEST_SIZE]
+            for i in range(0, len(unique_texts), EMBEDDING_REQUEST_SIZE)
+        ]
+        if len(requests) <= 1:
+            vectors = super().embed_documents(unique_texts, *args, **kwargs)
+        else:
+            embed = super().embed_documents
+            with ThreadPoolExecutor(max_workers=EMBEDDING_MAX_CONCURRENCY) as executor:
+                results = executor.map(lambda request: embed(request, *args, **kwargs), requests)
+                vectors = [vector for result in results for vector in result]
+        
+        if len(unique_texts) == len(texts):
+            return vectors
+        by_text = dict(zip(unique_texts, vectors))
+        return [by_text[text] for text in texts]
+
+
+@functools.lru_cache(maxsize=None)
+def get_embeddings(model: str) -> GoogleGenerativeAIEmbeddings:
+    """Return a shared embeddings client per model so connections are reused across indexers."""
+    return IndexingEmbeddings(model=model)
+
+
+def _load_markdown_file(path: Path) -> Document:
+    """Read one markdown file into a Document with the same metadata as TextLoader."""
+    return Document(page_content=path.read_text(encoding="utf-8"), metadata={"source": str(path)})
+
+
+def load_markdown_documents(export_path: Path) -> Iterator[Document]:
+    """Lazily load all non-empty markdown files below export_path using a thread pool.
+    
+    Only LOADER_READ_AHEAD files are read ahead of the consumer, so memory stays bounded
+    while index() is still embedding earlier batches.
+    """
+    paths = iter_markdown_files(export_path)
+    with ThreadPoolExecutor(max_workers=LOADER_MAX_CONCURRENCY) as executor:
+        pending = deque(
+            executor.submit(_load_markdown_file, path)
+            for path in itertools.islice(paths, LOADER_READ_AHEAD)
+        )
+        while pending:
+            document = pending.popleft().result()
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append(executor.submit(_load_markdown_file, next_path))
+            yield document
 
 
 class BaseIndexer(ABC):
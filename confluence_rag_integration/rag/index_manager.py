@@ -1,7 +1,6 @@
 """Index manager to orchestrate indexing operations."""
 
 import time
-from datetime import datetime
 from pathlib import Path
 
 from ..customers.customer_manager import CustomerManager
@@ -32,7 +31,6 @@ class IndexManager:
                     status="no_documents",
                     documents_indexed=0,
                     chunks_created=0,
-                    timestamp=datetime.now().isoformat(),
                     duration_seconds=duration
                 )
                 self.customer_manager.update_index_state(customer_id, result.__dict__)
@@ -48,7 +46,6 @@ class IndexManager:
                 status=index_result["status"],
                 documents_indexed=index_result["documents_indexed"],
                 chunks_created=index_result["chunks_created"],
-                timestamp=datetime.now().isoformat(),
                 duration_seconds=duration
             )
             
@@ -63,7 +60,6 @@ class IndexManager:
                 status="failed",
                 documents_indexed=0,
                 chunks_created=0,
-                timestamp=datetime.now().isoformat(),
                 duration_seconds=duration
             )
             
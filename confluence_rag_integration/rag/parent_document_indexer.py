@@ -1,53 +1,31 @@
 """Parent Document indexer using PostgreSQL+pgvector with ParentDocumentRetriever."""
 
-import re
+import uuid
 from pathlib import Path
 from typing import Dict, Any
 
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_postgres import PGVector
 from langchain.retrievers import ParentDocumentRetriever
 from langchain.indexes import SQLRecordManager, index
 
-from .base_indexer import BaseIndexer
+from .base_indexer import (
+    EMBEDDING_BATCH_SIZE,
+    BaseIndexer,
+    get_embeddings,
+    load_markdown_documents,
+)
 from ..shared.models import CustomerConfig
+from ..shared.utils import extract_metadata_from_content
 from ..util.store import PostgresByteStore
 
 
-def extract_metadata_from_content(content: str) -> dict:
-    """Extract metadata from markdown content."""
-    lines = content.split('\n')
-    
-    # Default values
-    title = "Untitled"
-    breadcrumb_str = "Uncategorized"
-
-    # Find Breadcrumb (usually the first line with '>')
-    for line in lines:
-        if '>' in line:
-            # Extracts text from within markdown links like [Text](link)
-            parts = re.findall(r'\[(.*?)\]', line)
-            if parts:
-                breadcrumb_str = ' > '.join(parts)
-                break
-    
-    # Find Title (the first line starting with '# ')
-    for line in lines:
-        if line.startswith('# '):
-            title = line.strip('# ').strip()
-            break
-
-    return {"title": title, "breadcrumb": breadcrumb_str}
-
-
 class ParentDocumentIndexer(BaseIndexer):
     """Indexer using ParentDocumentRetriever for better context retrieval."""
     
     def __init__(self, customer_config: CustomerConfig):
         self.customer_config = customer_config
-        self.embeddings = GoogleGenerativeAIEmbeddings(model=customer_config.embedding_model)
+        self.embeddings = get_embeddings(customer_config.embedding_model)
         self.vector_store = PGVector(
             embeddings=self.embeddings,
             collection_name=customer_config.collection_name,
@@ -86,13 +64,7 @@ class ParentDocumentIndexer(BaseIndexer):
     def build_index(self, export_path: Path) -> Dict[str, Any]:
         """Build index from exported markdown files."""
         # Load documents
-        loader = DirectoryLoader(
-            str(export_path),
-            glob="**/*.md",
-            loader_cls=TextLoader,
-            show_progress=True
-        )
-        raw_docs = loader.load()
+        raw_docs = list(load_markdown_documents(export_path))
         
         if not raw_docs:
             return {
@@ -112,26 +84,33 @@ class ParentDocumentIndexer(BaseIndexer):
             doc.metadata["source"] = doc.metadata.get("source", doc.metadata.get("file_path", "unknown"))
             processed_docs.append(doc)
         
-        # Add documents to parent document retriever
-        self.retriever.add_documents(processed_docs)
-        
-        # Get child documents for change tracking
+        # Split parents and children ourselves instead of calling retriever.add_documents,
+        # which would embed every child chunk a second time before the indexing API below.
+        # Parent ids are derived from the source so unchanged children hash identically
+        # between runs and are skipped by the record manager.
+        parent_entries = []
         child_docs = []
         for doc in processed_docs:
-            # Split into parent chunks
             parent_chunks = self.parent_splitter.split_documents([doc])
-            for parent_chunk in parent_chunks:
-                # Split parent into child chunks
+            for position, parent_chunk in enumerate(parent_chunks):
+                parent_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{doc.metadata['source']}#{position}"))
+                parent_entries.append((parent_id, parent_chunk))
+                
                 children = self.child_splitter.split_documents([parent_chunk])
+                for child in children:
+                    child.metadata[self.retriever.id_key] = parent_id
                 child_docs.extend(children)
         
-        # Apply indexing API for change tracking
+        self.docstore.mset(parent_entries)
+        
+        # Embed and store child chunks in batches with change tracking
         result = index(
             child_docs,
             self.record_manager,
             self.vector_store,
             cleanup="incremental",
-            source_id_key="source"
+            source_id_key="source",
+            batch_size=EMBEDDING_BATCH_SIZE,
         )
         
         return {
@@ -1,19 +1,32 @@
 """Simplified query manager for document retrieval."""
 
-from typing import Dict, Any
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, Any, Optional, Tuple
 
 from ..customers.customer_manager import CustomerManager
-from ..shared.models import QueryResult
+from ..shared.models import CustomerConfig, QueryResult
 from .indexer_factory import IndexerFactory
 from .base_indexer import BaseIndexer
 
+# Repeated questions are answered from memory until the index is rebuilt or the entry expires
+QUERY_CACHE_TTL_SECONDS = 24 * 60 * 60
+QUERY_CACHE_MAX_ENTRIES = 1024
+
 
 class QueryManager:
     """Simple query manager that only retrieves documents."""
     
     def __init__(self, customer_manager: CustomerManager):
         self.customer_manager = customer_manager
-        self._indexers: Dict[str, BaseIndexer] = {}  # Cache indexer instances
+        self._indexers: Dict[str, Tuple[CustomerConfig, BaseIndexer]] = {}  # Cache indexer instances
+        self._lock = threading.Lock()  # Guards both caches; managers are shared across threads
+        # (customer_id, question, top_k) -> (expires_at, index_timestamp, result)
+        self._results: OrderedDict = OrderedDict()
     
     def query(self, customer_id: str, question: str, top_k: int = 5) -> QueryResult:
         """Query documents for a customer."""
@@ -29,6 +42,13 @@ class QueryManager:
                     error="Customer RAG system not ready. Run export and index first."
                 )
             
+            # Serve repeated questions from cache while the index is unchanged
+            index_timestamp = state.last_index.get("timestamp")
+            cache_key = (customer_id, " ".join(question.casefold().split()), top_k)
+            cached = self._get_cached_result(cache_key, index_timestamp)
+            if cached:
+                return replace(cached, question=question)
+            
             # Get or create indexer from cache
             indexer = self._get_indexer(customer_id)
             
@@ -45,12 +65,14 @@ class QueryManager:
                     "source": doc.metadata.get("source", "unknown")
                 })
             
-            return QueryResult(
+            result = QueryResult(
                 customer_id=customer_id,
                 question=question,
                 documents=documents,
                 status="success"
             )
+            self._cache_result(cache_key, index_timestamp, result)
+            return result
             
         except Exception as e:
             return QueryResult(
@@ -61,10 +83,50 @@ class QueryManager:
                 error=str(e)
             )
     
+    async def aquery(self, customer_id: str, question: str, top_k: int = 5) -> QueryResult:
+        """Query documents for a customer without blocking the event loop."""
+        # The vector stores use sync engines, so the blocking query runs in a worker thread
+        return await asyncio.to_thread(self.query, customer_id, question, top_k)
+    
+    def _get_cached_result(self, key: Tuple[str, str, int], index_timestamp: Optional[str]) -> Optional[QueryResult]:
+        """Return a cached result if it has not expired and the index has not been rebuilt."""
+        with self._lock:
+            cached = self._results.get(key)
+            if cached and cached[0] > time.monotonic() and cached[1] == index_timestamp:
+                self._results.move_to_end(key)
+                return cached[2]
+        return None
+    
+    def _cache_result(self, key: Tuple[str, str, int], index_timestamp: Optional[str], result: QueryResult) -> None:
+        """Store a successful result, evicting the least recently used entry when full."""
+        with self._lock:
+            self._results[key] = (time.monotonic() + QUERY_CACHE_TTL_SECONDS, index_timestamp, result)
+            self._results.move_to_end(key)
+            if len(self._results) > QUERY_CACHE_MAX_ENTRIES:
+                self._results.popitem(last=False)
+    
     def _get_indexer(self, customer_id: str) -> BaseIndexer:
-        """Get or create cached indexer for customer."""
-        if customer_id not in self._indexers:
-            config = self.customer_manager.load_customer(customer_id)
-            self._indexers[customer_id] = IndexerFactory.create_indexer(config)
+        """Get or create cached indexer for customer, rebuilding it when the config changes."""
+        config = self.customer_manager.load_customer(customer_id)
+        with self._lock:
+            cached = self._indexers.get(customer_id)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        
+        # Build outside the lock: creating an indexer connects to the database, and holding
+        # the lock meanwhile would stall queries for every other customer
+        indexer = IndexerFactory.create_indexer(config)
+        with self._lock:
+            cached = self._indexers.get(customer_id)
+            # Keep another thread's indexer if it already finished one for this config
+            if cached is None or cached[0] is not config:
+                cached = (config, indexer)
+                self._indexers[customer_id] = cached
         
-        return self._indexers[customer_id]
\ No newline at end of file
+        return cached[1]
+
+
+@functools.lru_cache(maxsize=1)
+def get_query_manager() -> QueryManager:
+    """Return the process-wide query manager so indexers and vector store connections are reused."""
+    return QueryManager(CustomerManager())
@@ -1,18 +1,21 @@
 """Simple indexer using direct vector store with markdown header splitting."""
 
-import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator
 
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
 from langchain.text_splitter import MarkdownHeaderTextSplitter
 from langchain_core.documents import Document
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_postgres import PGVector
 from langchain.indexes import SQLRecordManager, index
 
-from .base_indexer import BaseIndexer
+from .base_indexer import (
+    EMBEDDING_BATCH_SIZE,
+    BaseIndexer,
+    get_embeddings,
+    load_markdown_documents,
+)
 from ..shared.models import CustomerConfig
+from ..shared.utils import extract_metadata_from_content
 
 
 class SimpleIndexer(BaseIndexer):
@@ -20,7 +23,7 @@ class SimpleIndexer(BaseIndexer):
     
     def __init__(self, customer_config: CustomerConfig):
         self.customer_config = customer_config
-        self.embeddings = GoogleGenerativeAIEmbeddings(model=customer_config.embedding_model)
+        self.embeddings = get_embeddings(customer_config.embedding_model)
         self.vector_store = PGVector(
             embeddings=self.embeddings,
             collection_name=customer_config.collection_name,
@@ -40,54 +43,43 @@ class SimpleIndexer(BaseIndexer):
             strip_headers=False
         )
     
-    def extract_metadata_from_content(self, content: str) -> dict:
-        """Parse markdown file to find breadcrumb and title."""
-        lines = content.split('\n')
-        
-        # Default values
-        title = "Untitled"
-        breadcrumb_str = "Uncategorized"
-
-        # Find Breadcrumb (usually the first line with '>')
-        for line in lines:
-            if '>' in line:
-                # Extracts text from within markdown links like [Text](link)
-                parts = re.findall(r'\[(.*?)\]', line)
-                if parts:
-                    breadcrumb_str = ' > '.join(parts)
-                    break
-        
-        # Find Title (the first line starting with '# ')
-        for line in lines:
-            if line.startswith('# '):
-                title = line.strip('# ').strip()
-                break
-
-        return {"title": title, "breadcrumb": breadcrumb_str}
-    
     def build_index(self, export_path: Path) -> Dict[str, Any]:
         """Build index from exported markdown files."""
-        # Load documents
-        loader = DirectoryLoader(
-            str(export_path),
-            glob="**/*.md",
-            loader_cls=TextLoader,
-            show_progress=True,
+        loaded = {"documents": 0}
+        
+        # Chunks are produced lazily and consumed by index() in batches, so only one
+        # batch of enriched chunks is held in memory at a time
+        result = index(
+            self._iter_enriched_chunks(load_markdown_documents(export_path), export_path, loaded),
+            self.record_manager,
+            self.vector_store,
+            cleanup="incremental",
+            source_id_key="source",
+            batch_size=EMBEDDING_BATCH_SIZE,
         )
-        docs = loader.load()
         
-        if not docs:
+        if not loaded["documents"]:
             return {
                 "status": "no_documents",
                 "documents_indexed": 0,
                 "chunks_created": 0,
             }
-
-        all_enriched_chunks = []
         
+        return {
+            "status": "success",
+            "documents_indexed": loaded["documents"],
+            "chunks_created": result.get('num_added', 0) + result.get('num_updated', 0),
+        }
+    
+    def _iter_enriched_chunks(
+        self, docs: Iterable[Document], export_path: Path, loaded: Dict[str, int]
+    ) -> Iterator[Document]:
+        """Split documents into chunks enriched with document-level metadata."""
         for doc in docs:
+            loaded["documents"] += 1
+            
             # Extract metadata from the full document content
-            doc_metadata = self.extract_metadata_from_content(doc.page_content)
+            doc_metadata = extract_metadata_from_content(doc.page_content)
 
             # Split the document into text chunks
             chunks = self.markdown_splitter.split_text(doc.page_content)
@@ -112,22 +104,7 @@ class SimpleIndexer(BaseIndexer):
                     doc.metadata.get("file_path", f"{export_path}/{doc_metadata['title']}.md")
                 )
                 
-                all_enriched_chunks.append(chunk)
-
-        # Index documents with automatic duplicate detection
-        result = index(
-            all_enriched_chunks,
-            self.record_manager,
-            self.vector_store,
-            cleanup="incremental",
-            source_id_key="source"
-        )
-        
-        return {
-            "status": "success",
-            "documents_indexed": len(docs),
-            "chunks_created": result.get('num_added', 0) + result.get('num_updated', 0),
-        }
+                yield chunk
     
     def clear_index(self) -> None:
         """Clear the existing index."""
@@ -1,11 +1,23 @@
 """Simplified data models for the multi-tenant Confluence RAG integration system."""
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Final, List, Optional, Dict, Any
+from datetime import datetime, timezone
 from pathlib import Path
 
 
+# RAG status values stored in CustomerState.rag_status
+RAG_NEVER_BUILT: Final = "never_built"
+RAG_BUILDING: Final = "building"
+RAG_READY: Final = "ready"
+RAG_FAILED: Final = "failed"
+
+
+def utc_timestamp() -> str:
+    """Current UTC time in ISO format."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 @dataclass
 class CustomerConfig:
     """Customer configuration from config.yaml"""
@@ -33,11 +45,11 @@ class CustomerState:
     customer_id: str
     last_export: Optional[Dict[str, Any]] = None  # {timestamp, status, pages_exported, errors}
     last_index: Optional[Dict[str, Any]] = None   # {timestamp, status, documents_indexed, chunks_created}
-    rag_status: str = "never_built"  # never_built, building, ready, failed
+    rag_status: str = RAG_NEVER_BUILT  # never_built, building, ready, failed
     
     @property
     def is_ready_for_queries(self) -> bool:
-        return self.rag_status == "ready" and self.last_index is not None
+        return self.rag_status == RAG_READY and self.last_index is not None
 
 
 @dataclass
@@ -46,8 +58,8 @@ class ExportResult:
     status: str  # success, partial, failed
     pages_exported: int
     errors: List[str]
-    timestamp: str  # ISO format
     duration_seconds: float
+    timestamp: str = field(default_factory=utc_timestamp)  # ISO format, UTC
 
 
 @dataclass
@@ -56,8 +68,8 @@ class IndexResult:
     status: str  # success, no_documents, failed
     documents_indexed: int
     chunks_created: int
-    timestamp: str  # ISO format
     duration_seconds: float
+    timestamp: str = field(default_factory=utc_timestamp)  # ISO format, UTC
 
 
 @dataclass
@@ -1,16 +1,21 @@
 """Shared utilities for the Confluence RAG integration system."""
 
+import functools
 import hashlib
 import os
 import re
-import secrets
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-import base64
+import orjson
+
+if TYPE_CHECKING:
+    # cryptography is heavy to load, so it is imported lazily by the credential helpers
+    from cryptography.fernet import Fernet
+
+
+# (customer_id, absolute base_path) pairs whose directory tree was already created in this process
+_ensured_dirs: set[tuple[str, str]] = set()
 
 
 def sanitize_customer_id(customer_id: str) -> str:
@@ -72,6 +77,12 @@ def ensure_customer_directory(customer_id: str, base_path: Optional[Path] = None
     customer_id = sanitize_customer_id(customer_id)
     customer_path = base_path / customer_id
     
+    # abspath is lexical (no per-component stat) but still tells trees apart across a chdir;
+    # re-check existence in case the directory was removed (e.g. by test cleanup)
+    key = (customer_id, os.path.abspath(base_path))
+    if key in _ensured_dirs and customer_path.is_dir():
+        return customer_path
+    
     # Create directory structure
     directories = [
         customer_path,
@@ -84,9 +95,28 @@ def ensure_customer_directory(customer_id: str, base_path: Optional[Path] = None
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
     
+    _ensured_dirs.add(key)
     return customer_path
 
 
+@functools.lru_cache(maxsize=16)
+def _derive_key(password: str) -> bytes:
+    """Derive a key from password; memoized so PBKDF2 runs once per password per process."""
+    import base64
+
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    salt = b'confluence_rag_salt'  # In production, use random salt and store it
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+
+
 def get_encryption_key(password: Optional[str] = None) -> bytes:
     """
     Generate or derive an encryption key for credential storage.
@@ -102,16 +132,11 @@ def get_encryption_key(password: Optional[str] = None) -> bytes:
         In production, you should use a secure key management system.
     """
     if password:
-        # Derive key from password
-        salt = b'confluence_rag_salt'  # In production, use random salt and store it
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return key
+        return _derive_key(password)
+    
+    import base64
+
+    from cryptography.fernet import Fernet
     
     # Try to get key from environment
     env_key = os.getenv('CONFLUENCE_RAG_ENCRYPTION_KEY')
@@ -122,6 +147,24 @@ def get_encryption_key(password: Optional[str] = None) -> bytes:
     return Fernet.generate_key()
 
 
+@functools.lru_cache(maxsize=16)
+def _get_password_fernet(password: str) -> "Fernet":
+    """Return a shared Fernet instance for the key derived from password."""
+    from cryptography.fernet import Fernet
+
+    return Fernet(_derive_key(password))
+
+
+def _get_fernet(password: Optional[str] = None) -> "Fernet":
+    """Return a Fernet instance; only password-derived keys are cached, env/random keys are re-read."""
+    if password:
+        return _get_password_fernet(password)
+    
+    from cryptography.fernet import Fernet
+
+    return Fernet(get_encryption_key())
+
+
 def encrypt_credentials(data: str, password: Optional[str] = None) -> str:
     """
     Encrypt sensitive data like API tokens.
@@ -133,9 +176,9 @@ def encrypt_credentials(data: str, password: Optional[str] = None) -> str:
     Returns:
         Base64-encoded encrypted data
     """
-    key = get_encryption_key(password)
-    fernet = Fernet(key)
-    encrypted_data = fernet.encrypt(data.encode())
+    import base64
+
+    encrypted_data = _get_fernet(password).encrypt(data.encode())
     return base64.urlsafe_b64encode(encrypted_data).decode()
 
 
@@ -153,10 +196,10 @@ def decrypt_credentials(encrypted_data: str, password: Optional[str] = None) ->
     Raises:
         cryptography.fernet.InvalidToken: If decryption fails
     """
-    key = get_encryption_key(password)
-    fernet = Fernet(key)
+    import base64
+
     encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
-    decrypted_data = fernet.decrypt(encrypted_bytes)
+    decrypted_data = _get_fernet(password).decrypt(encrypted_bytes)
     return decrypted_data.decode()
 
 
@@ -173,6 +216,70 @@ def generate_content_hash(content: str) -> str:
     return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
 
+def generate_content_hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Generate a hash of a file's content without loading it into memory at once.
+    
+    Args:
+        path: File to hash
+        chunk_size: Number of bytes read per iteration (defaults to 1 MiB)
+        
+    Returns:
+        SHA-256 hash of the file content, identical to generate_content_hash
+        for a UTF-8 encoded file
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb', buffering=0) as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert types orjson cannot serialize natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_model(obj: Any) -> bytes:
+    """
+    Serialize a result or state dataclass to JSON bytes.
+    
+    Args:
+        obj: Dataclass instance (or plain dict) to serialize
+        
+    Returns:
+        UTF-8 encoded, indented JSON ready to be written to disk
+    """
+    return orjson.dumps(
+        obj,
+        default=_json_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC,
+    )
+
+
+def iter_markdown_files(root: Path) -> Iterator[Path]:
+    """
+    Recursively yield non-empty markdown files below a directory.
+    
+    Uses os.scandir so directory entries are classified without an extra stat call,
+    and only .md files are stat'ed to skip empty exports.
+    
+    Args:
+        root: Directory to search
+        
+    Yields:
+        Paths of markdown files with content
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_markdown_files(Path(entry.path))
+            elif entry.name.endswith('.md') and entry.stat().st_size > 0:
+                yield Path(entry.path)
+
+
 def safe_filename(filename: str, max_length: int = 255) -> str:
     """
     Convert a string to a safe filename by removing/replacing invalid characters.
@@ -300,35 +407,46 @@ def get_environment_variable(key: str, default: Optional[str] = None, required:
     return value
 
 
+# Extracts text from within markdown links like [Text](link)
+_LINK_TEXT_RE = re.compile(r'\[(.*?)\]')
+
+
 def extract_metadata_from_content(content: str) -> dict:
     """
     Parses the full text of a markdown file to find the breadcrumb and title.
 
+    Lines are scanned in place and the scan stops as soon as both values are found,
+    so only the header of large pages is ever touched.
+
     Args:
         content: The raw string content of a .md file.
 
     Returns:
         A dictionary containing the 'title' and 'breadcrumb'.
     """
-    lines = content.split('\n')
-    
-    # Default values
-    title = "Untitled"
-    breadcrumb_str = "Uncategorized"
-
-    # Find Breadcrumb (usually the first line with '>')
-    for line in lines:
-        if '>' in line:
-            # Extracts text from within markdown links like [Text](link)
-            parts = re.findall(r'\[(.*?)\]', line)
+    title = None
+    breadcrumb_str = None
+
+    start = 0
+    length = len(content)
+    while start <= length and (title is None or breadcrumb_str is None):
+        end = content.find('\n', start)
+        if end == -1:
+            end = length
+        line = content[start:end]
+        start = end + 1
+
+        # Breadcrumb is the first line with '>' that contains links
+        if breadcrumb_str is None and '>' in line:
+            parts = _LINK_TEXT_RE.findall(line)
             if parts:
                 breadcrumb_str = ' > '.join(parts)
-                break # Stop after finding the first breadcrumb line
-    
-    # Find Title (the first line starting with '# ')
-    for line in lines:
-        if line.startswith('# '):
+
+        # Title is the first line starting with '# '
+        if title is None and line.startswith('# '):
             title = line.strip('# ').strip()
-            break # Stop after finding the main title
 
-    return {"title": title, "breadcrumb": breadcrumb_str} 
\ No newline at end of file
+    return {
+        "title": "Untitled" if title is None else title,
+        "breadcrumb": "Uncategorized" if breadcrumb_str is None else breadcrumb_str,
+    }
@@ -1,5 +1,5 @@
 """LangChain tools for the Confluence RAG integration."""
 
-from .knowledge_retrieval_tool import KnowledgeRetrievalTool, create_retrieval_tool
+from .knowledge_retrieval_tool import confluence_knowledge_retrieval, create_retrieval_tool
 
-__all__ = ["KnowledgeRetrievalTool", "create_retrieval_tool"]
\ No newline at end of file
+__all__ = ["confluence_knowledge_retrieval", "create_retrieval_tool"]
\ No newline at end of file
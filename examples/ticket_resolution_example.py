@@ -20,11 +20,11 @@ def example_direct_tool_usage():
     tool = create_retrieval_tool()
     
     # Use the tool directly
-    result = tool._run(
-        query="How do I reset my password?",
-        customer_id="acme_corp",
-        top_k=3
-    )
+    result = tool.invoke({
+        "query": "How do I reset my password?",
+        "customer_id": "acme_corp",
+        "top_k": 3
+    })
     
     print("Tool Result:")
     print(result)
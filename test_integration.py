@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Integration test for the refactored Confluence RAG system."""
 
+import asyncio
 import os
 import shutil
 from pathlib import Path
@@ -10,9 +11,12 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Import the simple API functions
-from confluence_rag_integration import export_customer, index_customer, query_customer
+from confluence_rag_integration import aquery_customer_many, export_customer, index_customer
 from confluence_rag_integration.customers.customer_manager import CustomerManager
 
+# Maximum number of test queries in flight at once
+MAX_CONCURRENT_QUERIES = 3
+
 
 def test_integration_workflow():
     """Test the complete workflow: create customer, export, index, query."""
@@ -56,9 +60,12 @@ def test_integration_workflow():
             "How do I register for two-step authentication?"
         ]
         
-        for question in test_questions:
+        query_results = asyncio.run(aquery_customer_many(
+            customer_config.customer_id, test_questions, max_concurrency=MAX_CONCURRENT_QUERIES
+        ))
+        
+        for question, query_result in zip(test_questions, query_results):
             print(f"\n🤔 Question: {question}")
-            query_result = query_customer(customer_config.customer_id, question)
             
             if query_result.status == "success":
                 print(f"✅ Found {len(query_result.documents)} relevant documents")